@@ -3,26 +3,22 @@ import os
 
 import aws_cdk as cdk
 
-from catalog_cdk_mysql.catalog_cdk_mysql_stack import CatalogCdkMysqlStack
+from catalog_cdk_mysql.catalog_cdk_mysql_stack import CatalogServerStack
 
 
-app = cdk.App()
-CatalogCdkMysqlStack(app, "CatalogCdkMysqlStack",
-    # If you don't specify 'env', this stack will be environment-agnostic.
-    # Account/Region-dependent features and context lookups will not work,
-    # but a single synthesized template can be deployed anywhere.
+def main() -> None:
+    app = cdk.App()
+    CatalogServerStack(app, "CatalogServerStack",
+        # Specialize this stack for the AWS Account and Region that are implied
+        # by the current CLI configuration, so availability zone lookups work
+        # and are cached in cdk.context.json.
+        env=cdk.Environment(account=os.getenv('CDK_DEFAULT_ACCOUNT'), region=os.getenv('CDK_DEFAULT_REGION')),
 
-    # Uncomment the next line to specialize this stack for the AWS Account
-    # and Region that are implied by the current CLI configuration.
+        # For more information, see https://docs.aws.amazon.com/cdk/latest/guide/environments.html
+        )
 
-    #env=cdk.Environment(account=os.getenv('CDK_DEFAULT_ACCOUNT'), region=os.getenv('CDK_DEFAULT_REGION')),
+    app.synth()
 
-    # Uncomment the next line if you know exactly what Account and Region you
-    # want to deploy the stack to. */
 
-    #env=cdk.Environment(account='123456789012', region='us-east-1'),
-
-    # For more information, see https://docs.aws.amazon.com/cdk/latest/guide/environments.html
-    )
-
-app.synth()
+if __name__ == "__main__":
+    main()
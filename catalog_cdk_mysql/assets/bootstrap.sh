@@ -0,0 +1,201 @@
+#!/bin/bash
+# Bootstrap a catalog server instance.
+# Usage: bootstrap.sh <region> <db-secret-arn> <db-endpoint-address> <redis-endpoint-address> <launch-hook-name>
+REGION="$1"
+DB_SECRET_ARN="$2"
+DB_ENDPOINT="$3"
+REDIS_ENDPOINT="$4"
+LAUNCH_HOOK_NAME="$5"
+
+# Install packages and the app venv unless the AMI already has them baked in
+if [ ! -x /home/ubuntu/catalog_server/venv/bin/gunicorn ]; then
+    apt update && apt upgrade -y
+    # Install Nginx, Python, and the MySQL client
+    apt install nginx python3 python3-pip python3-venv mysql-client libmysqlclient-dev pkg-config awscli jq -y
+    # Set up Flask application environment
+    mkdir -p /home/ubuntu/catalog_server
+    python3 -m venv /home/ubuntu/catalog_server/venv
+    if [ -f /tmp/wheels.zip ]; then
+        # Install from the wheelhouse shipped alongside this script
+        python3 -m zipfile -e /tmp/wheels.zip /tmp/wheels
+        /home/ubuntu/catalog_server/venv/bin/pip install --no-index --find-links=/tmp/wheels /tmp/wheels/*.whl
+    else
+        /home/ubuntu/catalog_server/venv/bin/pip install flask flask_sqlalchemy mysqlclient gunicorn redis orjson
+    fi
+fi
+# Write database and cache connection settings for the app
+DB_SECRET=$(aws secretsmanager get-secret-value --region "$REGION" --secret-id "$DB_SECRET_ARN" --query SecretString --output text)
+echo "DB_HOST=$DB_ENDPOINT" > /etc/catalog.env
+echo "DB_USER=$(echo "$DB_SECRET" | jq -r .username)" >> /etc/catalog.env
+echo "DB_PASSWORD=$(echo "$DB_SECRET" | jq -r .password)" >> /etc/catalog.env
+echo "REDIS_HOST=$REDIS_ENDPOINT" >> /etc/catalog.env
+echo "AWS_DEFAULT_REGION=$REGION" >> /etc/catalog.env
+echo "LAUNCH_HOOK_NAME=$LAUNCH_HOOK_NAME" >> /etc/catalog.env
+chmod 600 /etc/catalog.env && chown ubuntu /etc/catalog.env
+set -a && . /etc/catalog.env && set +a
+export MYSQL_PWD="$DB_PASSWORD"
+# Create catalog table and insert sample data (idempotent across instances)
+mysql -h "$DB_HOST" -u "$DB_USER" catalog -e "CREATE TABLE IF NOT EXISTS products (id INT AUTO_INCREMENT PRIMARY KEY, name VARCHAR(255) NOT NULL, description TEXT, price DECIMAL(10,2) NOT NULL) ENGINE=InnoDB ROW_FORMAT=DYNAMIC;"
+mysql -h "$DB_HOST" -u "$DB_USER" catalog -e "INSERT IGNORE INTO products (id, name, description, price) VALUES (1, 'Laptop', 'A high-end laptop', 1200.00), (2, 'Phone', 'Latest smartphone', 800.00);"
+# Create app.py
+cat > /home/ubuntu/catalog_server/app.py << EOL
+import os
+
+import orjson
+import redis
+from flask import Flask, Response, request
+from flask_sqlalchemy import SQLAlchemy
+
+app = Flask(__name__)
+app.config["SQLALCHEMY_DATABASE_URI"] = "mysql://{}:{}@{}/catalog".format(
+    os.environ["DB_USER"], os.environ["DB_PASSWORD"], os.environ["DB_HOST"]
+)
+# Reuse warm connections to the shared database across requests
+app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+    "pool_size": 10,
+    "max_overflow": 5,
+    "pool_pre_ping": True,
+    "pool_recycle": 1800,
+}
+db = SQLAlchemy(app)
+cache = redis.Redis(host=os.environ["REDIS_HOST"], socket_timeout=0.5)
+
+# Seconds a rendered page is served from Redis before hitting the database again
+CACHE_TTL = 30
+
+# Plain table rather than a model: rows are read-only and go straight to JSON.
+# Float converts MySQL DECIMAL values, which orjson cannot encode
+products_table = db.Table(
+    "products",
+    db.Column("id", db.Integer, primary_key=True),
+    db.Column("name", db.String(255), nullable=False),
+    db.Column("description", db.Text),
+    db.Column("price", db.Float, nullable=False),
+)
+
+@app.route("/products", methods=["GET"])
+def get_products():
+    # Keyset pagination on the primary key keeps each response one page long
+    after_id = request.args.get("after_id", 0, type=int)
+    limit = min(max(request.args.get("limit", 50, type=int), 1), 500)
+    key = "products:{}:{}".format(after_id, limit)
+
+    # Fall back to the database if the cache is unreachable
+    try:
+        data = cache.get(key)
+    except redis.RedisError:
+        data = None
+    if data is None:
+        rows = db.session.execute(
+            db.select(products_table)
+            .where(products_table.c.id > after_id)
+            .order_by(products_table.c.id)
+            .limit(limit)
+        ).mappings()
+        # Column keys are str subclasses, which orjson only accepts with this option
+        data = orjson.dumps([dict(row) for row in rows], option=orjson.OPT_NON_STR_KEYS)
+        try:
+            cache.setex(key, CACHE_TTL, data)
+        except redis.RedisError:
+            pass
+
+    return Response(data, mimetype="application/json")
+
+if __name__ == "__main__":
+    app.run(host="0.0.0.0", port=5000)
+EOL
+# Create Nginx config
+# nginx only creates the last component of proxy_cache_path
+mkdir -p /var/cache/nginx
+# Quote the delimiter so nginx variables are not expanded by the shell
+cat > /etc/nginx/sites-available/catalog << 'EOL'
+proxy_cache_path /var/cache/nginx/catalog levels=1:2 keys_zone=products:10m max_size=100m inactive=10m;
+
+upstream catalog_app {
+    server 127.0.0.1:5000;
+    keepalive 32;
+    # Drop idle upstream connections before Gunicorn's --keep-alive closes them
+    keepalive_timeout 60s;
+}
+
+server {
+    listen 80;
+    server_name _;
+    # Outlive the ALB idle timeout so the ALB never reuses a closed connection
+    keepalive_timeout 125s;
+
+    gzip on;
+    gzip_types application/json;
+
+    location / {
+        proxy_pass http://catalog_app;
+        # Reuse upstream connections instead of opening one per request
+        proxy_http_version 1.1;
+        proxy_set_header Connection "";
+        # Serve repeated reads from the local cache; coalesce concurrent misses
+        proxy_cache products;
+        proxy_cache_valid 200 30s;
+        proxy_cache_lock on;
+        proxy_set_header Host $host;
+        proxy_set_header X-Real-IP $remote_addr;
+        proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;
+    }
+}
+EOL
+ln -s /etc/nginx/sites-available/catalog /etc/nginx/sites-enabled/
+rm -f /etc/nginx/sites-enabled/default  # Remove default site to avoid conflicts
+nginx -t && systemctl reload nginx
+# Create systemd service
+cat > /etc/systemd/system/catalog.service << EOL
+[Unit]
+Description=Catalog API Server
+After=network.target
+
+[Service]
+User=ubuntu
+WorkingDirectory=/home/ubuntu/catalog_server
+EnvironmentFile=/etc/catalog.env
+ExecStart=/home/ubuntu/catalog_server/venv/bin/gunicorn --workers 2 --threads 8 --worker-class gthread --keep-alive 75 --bind 0.0.0.0:5000 app:app
+Restart=always
+
+[Install]
+WantedBy=multi-user.target
+EOL
+systemctl daemon-reload
+systemctl start catalog
+systemctl enable catalog
+# Complete the ASG launch lifecycle hook once the catalog answers through nginx.
+# Runs on every boot so warm pool instances resumed from Stopped report in too
+cat > /usr/local/bin/catalog-ready << 'EOL'
+#!/bin/bash
+TOKEN=$(curl -s -X PUT http://169.254.169.254/latest/api/token -H "X-aws-ec2-metadata-token-ttl-seconds: 300")
+INSTANCE_ID=$(curl -s -H "X-aws-ec2-metadata-token: $TOKEN" http://169.254.169.254/latest/meta-data/instance-id)
+ASG_NAME=$(aws autoscaling describe-auto-scaling-instances --instance-ids "$INSTANCE_ID" --query "AutoScalingInstances[0].AutoScalingGroupName" --output text)
+RESULT=ABANDON
+for _ in $(seq 60); do
+    if curl -sf -o /dev/null http://127.0.0.1/products; then
+        RESULT=CONTINUE
+        break
+    fi
+    sleep 5
+done
+# Fails harmlessly when no lifecycle action is pending for this instance
+aws autoscaling complete-lifecycle-action --lifecycle-hook-name "$LAUNCH_HOOK_NAME" --auto-scaling-group-name "$ASG_NAME" --instance-id "$INSTANCE_ID" --lifecycle-action-result "$RESULT" || true
+EOL
+chmod +x /usr/local/bin/catalog-ready
+cat > /etc/systemd/system/catalog-ready.service << EOL
+[Unit]
+Description=Report catalog server readiness to Auto Scaling
+After=network-online.target nginx.service catalog.service
+Wants=network-online.target
+
+[Service]
+Type=oneshot
+EnvironmentFile=/etc/catalog.env
+ExecStart=/usr/local/bin/catalog-ready
+
+[Install]
+WantedBy=multi-user.target
+EOL
+systemctl daemon-reload
+systemctl enable --now catalog-ready
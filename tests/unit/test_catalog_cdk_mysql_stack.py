@@ -1,15 +1,144 @@
 import aws_cdk as core
 import aws_cdk.assertions as assertions
 
-from catalog_cdk_mysql.catalog_cdk_mysql_stack import CatalogCdkMysqlStack
+from catalog_cdk_mysql.catalog_cdk_mysql_stack import CatalogServerStack
 
 # example tests. To run these tests, uncomment this file along with the example
 # resource in catalog_cdk_mysql/catalog_cdk_mysql_stack.py
 def test_sqs_queue_created():
     app = core.App()
-    stack = CatalogCdkMysqlStack(app, "catalog-cdk-mysql")
+    stack = CatalogServerStack(app, "catalog-cdk-mysql")
     template = assertions.Template.from_stack(stack)
 
 #     template.has_resource_properties("AWS::SQS::Queue", {
 #         "VisibilityTimeout": 300
 #     })
+
+
+def test_warm_pool_launches_wait_for_lifecycle_hook():
+    app = core.App()
+    stack = CatalogServerStack(app, "catalog-cdk-mysql")
+    template = assertions.Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::AutoScaling::WarmPool", {
+        "MinSize": 2,
+        "PoolState": "Stopped",
+    })
+    template.has_resource_properties("AWS::AutoScaling::LifecycleHook", {
+        "LifecycleHookName": "catalog-launch",
+        "LifecycleTransition": "autoscaling:EC2_INSTANCE_LAUNCHING",
+        "DefaultResult": "ABANDON",
+    })
+
+
+def test_single_shared_database():
+    app = core.App()
+    stack = CatalogServerStack(app, "catalog-cdk-mysql")
+    template = assertions.Template.from_stack(stack)
+
+    template.resource_count_is("AWS::RDS::DBInstance", 1)
+    template.has_resource_properties("AWS::RDS::DBInstance", {
+        "Engine": "mysql",
+        "DBName": "catalog",
+        "PubliclyAccessible": False,
+    })
+
+
+def test_target_group_uses_least_outstanding_requests():
+    app = core.App()
+    stack = CatalogServerStack(app, "catalog-cdk-mysql")
+    template = assertions.Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::ElasticLoadBalancingV2::TargetGroup", {
+        "TargetGroupAttributes": assertions.Match.array_with([
+            {
+                "Key": "load_balancing.algorithm.type",
+                "Value": "least_outstanding_requests",
+            },
+        ]),
+    })
+
+
+def test_products_cache_reachable_only_from_servers():
+    app = core.App()
+    stack = CatalogServerStack(app, "catalog-cdk-mysql")
+    template = assertions.Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::ElastiCache::CacheCluster", {
+        "CacheNodeType": "cache.t3.micro",
+        "Engine": "redis",
+        "NumCacheNodes": 1,
+    })
+    template.has_resource_properties("AWS::EC2::SecurityGroupIngress", {
+        "IpProtocol": "tcp",
+        "FromPort": 6379,
+        "ToPort": 6379,
+        "SourceSecurityGroupId": assertions.Match.object_like({
+            "Fn::GetAtt": assertions.Match.array_with([assertions.Match.string_like_regexp("^ServerSG")]),
+        }),
+    })
+
+
+def test_scales_on_alb_request_count():
+    app = core.App()
+    stack = CatalogServerStack(app, "catalog-cdk-mysql")
+    template = assertions.Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::AutoScaling::ScalingPolicy", {
+        "TargetTrackingConfiguration": {
+            "PredefinedMetricSpecification": assertions.Match.object_like({
+                "PredefinedMetricType": "ALBRequestCountPerTarget",
+            }),
+            "TargetValue": 3000,
+        },
+    })
+
+
+def test_servers_use_t3a_small_with_unlimited_credits():
+    app = core.App()
+    stack = CatalogServerStack(app, "catalog-cdk-mysql")
+    template = assertions.Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::EC2::LaunchTemplate", {
+        "LaunchTemplateData": assertions.Match.object_like({
+            "InstanceType": "t3a.small",
+            "CreditSpecification": {"CpuCredits": "unlimited"},
+        }),
+    })
+
+
+def test_alb_enables_http2_and_longer_idle_timeout():
+    app = core.App()
+    stack = CatalogServerStack(app, "catalog-cdk-mysql")
+    template = assertions.Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::ElasticLoadBalancingV2::LoadBalancer", {
+        "LoadBalancerAttributes": assertions.Match.array_with([
+            {"Key": "routing.http2.enabled", "Value": "true"},
+            {"Key": "idle_timeout.timeout_seconds", "Value": "120"},
+        ]),
+    })
+
+
+def test_root_volume_is_encrypted_gp3():
+    app = core.App()
+    stack = CatalogServerStack(app, "catalog-cdk-mysql")
+    template = assertions.Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::EC2::LaunchTemplate", {
+        "LaunchTemplateData": assertions.Match.object_like({
+            "BlockDeviceMappings": [
+                {
+                    "DeviceName": "/dev/sda1",
+                    "Ebs": {
+                        "VolumeSize": 20,
+                        "VolumeType": "gp3",
+                        "Iops": 3000,
+                        "Throughput": 125,
+                        "DeleteOnTermination": True,
+                        "Encrypted": True,
+                    },
+                },
+            ],
+        }),
+    })